@@ -4,8 +4,11 @@ Loads album data from JSON files and parses track durations.
 """
 
 import json
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 DATA_DIR = Path(__file__).parent.parent / ".data" / "albums"
@@ -23,6 +26,20 @@ class Track:
 class Side:
     ind: str
     tracks: list[Track]
+    # Cumulative end time (seconds) of each track, parallel to `tracks`
+    track_ends: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.track_ends = list(accumulate(track.duration_seconds for track in self.tracks))
+
+    @property
+    def duration_seconds(self) -> int:
+        """Total duration of the side in seconds."""
+        return self.track_ends[-1] if self.track_ends else 0
+
+    def track_index_at(self, elapsed_seconds: float) -> int:
+        """Index of the track playing at elapsed_seconds (last track once past the end)."""
+        return min(bisect_right(self.track_ends, elapsed_seconds), len(self.tracks) - 1)
 
 
 @dataclass
@@ -36,21 +53,29 @@ def parse_duration(duration_str: str) -> int:
     """Convert duration string (M:SS or MM:SS) to seconds."""
     if not duration_str:
         return 0
-    parts = duration_str.split(":")
-    if len(parts) == 2:
-        minutes, seconds = int(parts[0]), int(parts[1])
-        return minutes * 60 + seconds
-    return 0
+    colon = duration_str.find(":")
+    if colon <= 0:
+        return 0
+    try:
+        return int(duration_str[:colon]) * 60 + int(duration_str[colon + 1:])
+    except ValueError:
+        return 0
 
 
 def load_album(album_id: int) -> Album | None:
     """Load album data from JSON file and parse durations to seconds."""
     filepath = DATA_DIR / f"{album_id}.json"
-    if not filepath.exists():
+    try:
+        mtime_ns = filepath.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
+    return _read_album(album_id, filepath, mtime_ns)
+
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+@lru_cache(maxsize=128)
+def _read_album(album_id: int, filepath: Path, mtime_ns: int) -> Album:
+    """Parse an album file; cached per modification time so edited files are reloaded."""
+    data = json.loads(filepath.read_bytes())
 
     sides = []
     for side_data in data.get("sides", []):
@@ -5,6 +5,7 @@ Downloads album metadata from Discogs API and saves as JSON.
 """
 
 import json
+import re
 import sys
 import time
 from pathlib import Path
@@ -13,15 +14,18 @@ import requests
 
 DISCOGS_API_BASE = "https://api.discogs.com"
 USER_AGENT = "VinylPlaybackMonitor/0.1"
+SIDE_LETTER_RE = re.compile(r"[A-Za-z]")
 DATA_DIR = Path(__file__).parent.parent / ".data" / "albums"
 
+# Shared session keeps the TLS connection to the API alive between requests
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+
 
 def make_request(url: str, params: dict | None = None, max_retries: int = 3) -> dict:
     """Make request to Discogs API with retry logic for rate limiting."""
-    headers = {"User-Agent": USER_AGENT}
-
     for _ in range(max_retries):
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = _SESSION.get(url, params=params, timeout=30)
 
         if response.status_code == 200:
             return response.json()
@@ -66,23 +70,24 @@ def display_results(results: list[dict], max_display: int = 10) -> None:
 
 def prompt_selection(max_choice: int) -> int | None:
     """Prompt user to select a result. Returns None if cancelled."""
-    try:
-        choice = input(f"Enter number (1-{max_choice}) or 'q' to quit: ").strip()
-    except (EOFError, KeyboardInterrupt):
-        return None
-
-    if not choice or choice.lower() == "q":
-        return None
+    while True:
+        try:
+            choice = input(f"Enter number (1-{max_choice}) or 'q' to quit: ").strip()
+        except (EOFError, KeyboardInterrupt):
+            return None
+
+        if not choice or choice.lower() == "q":
+            return None
+
+        try:
+            num = int(choice)
+        except ValueError:
+            print("Invalid input. Enter a number or 'q' to quit.")
+            continue
 
-    try:
-        num = int(choice)
         if 1 <= num <= max_choice:
             return num
         print(f"Please enter a number between 1 and {max_choice}")
-        return prompt_selection(max_choice)
-    except ValueError:
-        print("Invalid input. Enter a number or 'q' to quit.")
-        return prompt_selection(max_choice)
 
 
 def fetch_release(release_id: int) -> dict:
@@ -93,10 +98,8 @@ def fetch_release(release_id: int) -> dict:
 
 def get_side_letter(position: str) -> str:
     """Extract side letter from position (e.g., 'A1' -> 'A', 'B2' -> 'B')."""
-    for char in position:
-        if char.isalpha():
-            return char.upper()
-    return ""
+    match = SIDE_LETTER_RE.search(position)
+    return match.group().upper() if match else ""
 
 
 def transform_release(release: dict) -> tuple[dict, bool]:
@@ -111,8 +114,8 @@ def transform_release(release: dict) -> tuple[dict, bool]:
             cover = img.get("uri", "")
             break
 
-    # Group tracks by side
-    sides_dict: dict[str, list[dict]] = {}
+    # Group tracks by side; get_side_letter only yields A-Z, so index buckets by letter
+    side_buckets: list[list[dict]] = [[] for _ in range(26)]
     has_missing_durations = False
 
     for track in release.get("tracklist", []):
@@ -136,14 +139,13 @@ def transform_release(release: dict) -> tuple[dict, bool]:
             "duration": duration,
         }
 
-        if side_letter not in sides_dict:
-            sides_dict[side_letter] = []
-        sides_dict[side_letter].append(track_data)
+        side_buckets[ord(side_letter) - ord("A")].append(track_data)
 
-    # Convert to list sorted by side letter
+    # Buckets are already in side-letter order
     sides = [
-        {"ind": letter, "tracks": tracks}
-        for letter, tracks in sorted(sides_dict.items())
+        {"ind": chr(ord("A") + i), "tracks": tracks}
+        for i, tracks in enumerate(side_buckets)
+        if tracks
     ]
 
     transformed = {
@@ -168,8 +170,7 @@ def save_release(release: dict) -> Path:
     filename = f"{release_id}.json"
     filepath = DATA_DIR / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(transformed, f, indent=2, ensure_ascii=False)
+    filepath.write_text(json.dumps(transformed, indent=2, ensure_ascii=False), encoding="utf-8")
 
     return filepath
 
@@ -5,15 +5,17 @@ Detects music playback using microphone input, estimates current track, and disp
 """
 
 import json
+import math
+import os
 import numpy as np
 import pyaudio
+import queue
 import time
 import sys
-import select
 import termios
 import tty
 from enum import Enum
-from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from .album_loader import load_album, Album
@@ -22,14 +24,38 @@ from .track_estimator import TrackEstimator
 # Detection delay compensation (seconds) - accounts for time music plays before detection confirms
 DETECTION_DELAY_SECONDS = 10
 
+# Number of preallocated chunk slots shared between the audio callback and the analysis loop
+RING_CHUNKS = 8
+
+# Most consecutive chunks analyzed together when the analysis loop has a backlog
+MAX_BATCH_CHUNKS = 4
+
+# How long the analysis loop waits for a chunk before checking the stream is still running
+CHUNK_WAIT_SECONDS = 1.0
+
 # Debug file path
 DEBUG_FILE = Path(__file__).parent.parent / ".data" / "debug.json"
 
+# (mtime_ns, offset) of the last parsed debug file
+_debug_offset_cache: tuple[int, float] = (-1, 0.0)
+
 
 def get_debug_playback_offset() -> float:
-    """Read debug playback offset from .data/debug.json if it exists."""
-    if not DEBUG_FILE.exists():
+    """Read debug playback offset from .data/debug.json if it exists.
+
+    Called on every display tick, so the parsed value is reused until the file's
+    modification time changes.
+    """
+    global _debug_offset_cache
+    try:
+        mtime_ns = os.stat(DEBUG_FILE).st_mtime_ns
+    except FileNotFoundError:
         return 0.0
+    cached_mtime_ns, cached_offset = _debug_offset_cache
+    if mtime_ns == cached_mtime_ns:
+        return cached_offset
+
+    offset = 0.0
     try:
         with open(DEBUG_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
@@ -38,10 +64,47 @@ def get_debug_playback_offset() -> float:
             parts = playback.split(":")
             if len(parts) == 2:
                 minutes, seconds = int(parts[0]), int(parts[1])
-                return minutes * 60 + seconds
+                offset = minutes * 60 + seconds
     except (json.JSONDecodeError, ValueError, FileNotFoundError):
         pass
-    return 0.0
+
+    _debug_offset_cache = (mtime_ns, offset)
+    return offset
+
+
+def empty_aligned(shape: tuple[int, ...], dtype: type, alignment: int = 64) -> np.ndarray:
+    """Allocate an uninitialized array whose data starts on an `alignment`-byte boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = math.prod(shape) * dtype.itemsize
+    raw = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def next_fast_len(n: int) -> int:
+    """Smallest 5-smooth length (2**a * 3**b * 5**c) >= n; FFTs of other sizes are much slower."""
+    best = 1 << max(n - 1, 0).bit_length()
+    power_of_5 = 1
+    while power_of_5 < best:
+        odd = power_of_5
+        while odd < best:
+            length = odd
+            while length < n:
+                length *= 2
+            best = min(best, length)
+            odd *= 3
+        power_of_5 *= 5
+    return best
+
+
+@lru_cache(maxsize=8192)
+def format_seconds(seconds: int) -> str:
+    """Format whole seconds as MM:SS or HH:MM:SS (memoized; values repeat every display tick)."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
 
 
 class PlaybackState(Enum):
@@ -50,6 +113,13 @@ class PlaybackState(Enum):
     STOPPED = "STOPPED"
 
 
+STATUS_ICONS = {
+    PlaybackState.IDLE: "⏸",
+    PlaybackState.PLAYING: "▶",
+    PlaybackState.STOPPED: "⏹",
+}
+
+
 class KeyboardInput:
     """Non-blocking keyboard input handler for Unix."""
 
@@ -61,6 +131,11 @@ class KeyboardInput:
         """Set terminal to raw mode for non-blocking input."""
         self.old_settings = termios.tcgetattr(sys.stdin)
         tty.setcbreak(sys.stdin.fileno())
+        # VMIN=0/VTIME=0: read() returns immediately with no data when no key is waiting
+        attrs = termios.tcgetattr(sys.stdin)
+        attrs[6][termios.VMIN] = 0
+        attrs[6][termios.VTIME] = 0
+        termios.tcsetattr(sys.stdin, termios.TCSANOW, attrs)
 
     def restore(self):
         """Restore terminal settings."""
@@ -69,9 +144,8 @@ class KeyboardInput:
 
     def get_key(self) -> str | None:
         """Get a key if available, non-blocking. Returns None if no key."""
-        if select.select([sys.stdin], [], [], 0)[0]:
-            return sys.stdin.read(1)
-        return None
+        data = os.read(sys.stdin.fileno(), 1)
+        return data.decode(errors="ignore") or None
 
     def process_input(self, key: str) -> tuple[str | None, str]:
         """Process key input. Returns (action, current_buffer).
@@ -109,15 +183,42 @@ class AudioDetector:
         start_confirm_seconds: float = 2.0,
         stop_confirm_seconds: float = 5.0,
         display_interval: float = 0.2,
+        fft_decimation: int = 1,
     ):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
         self.rms_threshold = rms_threshold
         self.rms_stop_threshold = rms_stop_threshold
+        # sqrt is monotonic, so detection compares mean square against squared thresholds
+        self._mean_square_threshold = rms_threshold ** 2
+        self._mean_square_stop_threshold = rms_stop_threshold ** 2
         self.bandwidth_threshold = bandwidth_threshold
         self.start_confirm_seconds = start_confirm_seconds
         self.stop_confirm_seconds = stop_confirm_seconds
         self.display_interval = display_interval
+        # Keep every Nth sample for the bandwidth FFT; cheaper, but content above
+        # sample_rate / (2 * N) aliases down, so bandwidth_threshold must be retuned
+        self.fft_decimation = fft_decimation
+
+        # FFT input is zero-padded up to a fast transform length when the (decimated)
+        # chunk size has large prime factors
+        fft_size = len(range(0, chunk_size, fft_decimation))
+        self._nfft = next_fast_len(fft_size)
+
+        # Frequency grid is fixed by chunk size and sample rate, so build it once
+        self._freqs = np.fft.rfftfreq(self._nfft, fft_decimation / sample_rate)
+        # Columns weight the magnitude spectrum into its 0th, 1st and 2nd frequency moments;
+        # float32 to match the spectrum so the product stays single precision
+        self._moment_weights = np.stack(
+            [np.ones_like(self._freqs), self._freqs, self._freqs ** 2], axis=1
+        ).astype(np.float32)
+
+        # Hann window (applied in place into a reusable buffer) to limit spectral leakage
+        self._window = np.hanning(fft_size).astype(np.float32)
+        self._windowed = np.empty((MAX_BATCH_CHUNKS, fft_size), dtype=np.float32)
+        # Reusable FFT output buffers (complex spectrum and its magnitude), one row per chunk
+        self._spectrum = np.empty((MAX_BATCH_CHUNKS, len(self._freqs)), dtype=np.complex64)
+        self._magnitude = np.empty((MAX_BATCH_CHUNKS, len(self._freqs)), dtype=np.float32)
 
         self.state = PlaybackState.IDLE
         self.last_display_time = 0.0
@@ -129,58 +230,108 @@ class AudioDetector:
         self.audio = pyaudio.PyAudio()
         self.stream = None
 
+        # Preallocated ring of chunks filled by the audio callback; slot indices are
+        # handed to the analysis loop through a bounded queue. Cache-line aligned, so with
+        # the default power-of-two chunk size every slot starts on a SIMD vector boundary.
+        # The queue bound leaves MAX_BATCH_CHUNKS slots the callback never writes into
+        # while the analysis loop may still be reading them.
+        self._ring = empty_aligned((RING_CHUNKS, chunk_size), np.float32)
+        self._ready: queue.Queue[int] = queue.Queue(maxsize=RING_CHUNKS - MAX_BATCH_CHUNKS)
+        self._write_slot = 0
+        self.dropped_chunks = 0
+
         # Album and track estimation
         self.album: Album | None = None
         self.track_estimator: TrackEstimator | None = None
         self.keyboard = KeyboardInput()
         self.input_display = ""
+        self._last_status_line = ""
+
+    def compute_mean_square(self, chunks: np.ndarray) -> np.ndarray:
+        """Compute mean square amplitude (RMS squared) of each chunk (row) in a 2-D block."""
+        # einsum reduces each row in one pass without a squared temporary array
+        return np.einsum("ij,ij->i", chunks, chunks) / chunks.shape[1]
+
+    def compute_spectral_bandwidth(self, chunks: np.ndarray) -> np.ndarray:
+        """Compute spectral bandwidth of each chunk (row) in a 2-D block using FFT."""
+        count = len(chunks)
+        windowed = np.multiply(chunks[:, ::self.fft_decimation], self._window, out=self._windowed[:count])
+        spectrum = np.fft.rfft(windowed, n=self._nfft, axis=-1, out=self._spectrum[:count])
+        fft_data = np.abs(spectrum, out=self._magnitude[:count])
+
+        # Total power, centroid and second-moment sums in one pass over the spectrum
+        total_power, freq_sum, freq_sq_sum = (fft_data @ self._moment_weights).T
+
+        # Avoid division by zero: an all-zero spectrum yields zero bandwidth
+        total_power[total_power == 0] = np.inf
+
+        # Spectral centroid and bandwidth (weighted standard deviation)
+        centroid = freq_sum / total_power
+        variance = freq_sq_sum / total_power - centroid ** 2
+        return np.sqrt(np.maximum(variance, 0.0))
+
+    def _analyze(self, chunks: np.ndarray) -> list[tuple[float, float]]:
+        """Analyze consecutive chunks, returning (mean_square, bandwidth) per chunk for the state machine.
+
+        Chunks are passed as rows of a 2-D block so a backlog is handled with one
+        batched FFT. The FFT is skipped (bandwidth reported as 0.0) whenever it cannot
+        change the decision: while PLAYING only RMS is consulted, and below the RMS
+        start threshold music can't be detected anyway.
+        """
+        mean_square = self.compute_mean_square(chunks)
+        if self.state == PlaybackState.PLAYING or not (mean_square > self._mean_square_threshold).any():
+            bandwidth = np.zeros(len(chunks))
+        else:
+            bandwidth = self.compute_spectral_bandwidth(chunks)
+        return list(zip(mean_square.tolist(), bandwidth.tolist()))
 
-    def compute_rms(self, audio_data: np.ndarray) -> float:
-        """Compute Root Mean Square amplitude."""
-        return np.sqrt(np.mean(audio_data ** 2))
-
-    def compute_spectral_bandwidth(self, audio_data: np.ndarray) -> float:
-        """Compute spectral bandwidth using FFT."""
-        fft_data = np.abs(np.fft.rfft(audio_data))
-        freqs = np.fft.rfftfreq(len(audio_data), 1.0 / self.sample_rate)
-
-        # Avoid division by zero
-        total_power = np.sum(fft_data)
-        if total_power == 0:
-            return 0.0
-
-        # Compute spectral centroid
-        centroid = np.sum(freqs * fft_data) / total_power
+    def _process_chunks(self, chunks: np.ndarray) -> None:
+        """Run consecutive chunks through analysis and the state machine, in order.
 
-        # Compute spectral bandwidth (weighted standard deviation)
-        bandwidth = np.sqrt(np.sum(((freqs - centroid) ** 2) * fft_data) / total_power)
-        return bandwidth
+        Which chunks get an FFT depends on the state, so once a chunk changes the
+        state the remaining chunks are analyzed again under the new state.
+        """
+        start = 0
+        while start < len(chunks):
+            state = self.state
+            for mean_square, bandwidth in self._analyze(chunks[start:]):
+                self.update_state(mean_square, bandwidth)
+                start += 1
+                if self.state != state:
+                    break
 
-    def is_music_detected(self, audio_data: np.ndarray) -> bool:
+    def is_music_detected(self, mean_square: float, bandwidth: float) -> bool:
         """Check if audio characteristics indicate music playback."""
-        rms = self.compute_rms(audio_data)
-        bandwidth = self.compute_spectral_bandwidth(audio_data)
-        return rms > self.rms_threshold and bandwidth > self.bandwidth_threshold
+        return mean_square > self._mean_square_threshold and bandwidth > self.bandwidth_threshold
 
-    def is_silence_detected(self, audio_data: np.ndarray) -> bool:
+    def is_silence_detected(self, mean_square: float) -> bool:
         """Check if audio characteristics indicate silence."""
-        rms = self.compute_rms(audio_data)
-        return rms < self.rms_stop_threshold
+        return mean_square < self._mean_square_stop_threshold
+
+    def _on_audio(self, in_data: bytes, frame_count: int, time_info: dict, status_flags: int) -> tuple[None, int]:
+        """PyAudio stream callback: copy the chunk into the next free ring slot."""
+        if status_flags & pyaudio.paInputOverflow:
+            self.dropped_chunks += 1
+
+        # When analysis falls behind, drop the chunk instead of overwriting the slot being read
+        if self._ready.full():
+            self.dropped_chunks += 1
+        else:
+            slot = self._write_slot
+            self._ring[slot] = np.frombuffer(in_data, dtype=np.float32)
+            self._write_slot = (slot + 1) % RING_CHUNKS
+            self._ready.put_nowait(slot)
+        return (None, pyaudio.paContinue)
 
     def format_duration(self, seconds: float) -> str:
         """Format duration as HH:MM:SS."""
-        td = timedelta(seconds=int(seconds))
-        hours, remainder = divmod(td.seconds + td.days * 86400, 3600)
-        minutes, secs = divmod(remainder, 60)
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        return f"{minutes:02d}:{secs:02d}"
-
-    def update_state(self, audio_data: np.ndarray) -> None:
+        return format_seconds(int(seconds))
+
+    def update_state(self, mean_square: float, bandwidth: float) -> None:
         """Update playback state based on audio analysis."""
-        current_time = time.time()
-        music_detected = self.is_music_detected(audio_data)
-        silence_detected = self.is_silence_detected(audio_data)
+        current_time = time.monotonic()
+        music_detected = self.is_music_detected(mean_square, bandwidth)
+        silence_detected = self.is_silence_detected(mean_square)
 
         if self.state == PlaybackState.IDLE or self.state == PlaybackState.STOPPED:
             if music_detected:
@@ -206,23 +357,24 @@ class AudioDetector:
         self.playback_start_time = current_time - self.start_confirm_seconds
         self.candidate_start_time = None
         self.candidate_stop_time = None
-        print(f"\n{'='*50}")
-        print(f"▶ MUSIC STARTED at {time.strftime('%H:%M:%S')}")
+        # Banner is collected and written in one go to keep the analysis loop stall short
+        lines = ["", "=" * 50, f"▶ MUSIC STARTED at {time.strftime('%H:%M:%S')}"]
 
         # Check if we should auto-advance based on offset (debug mode)
         if self.track_estimator:
             initial_offset = DETECTION_DELAY_SECONDS + get_debug_playback_offset()
             elapsed_on_side = self.track_estimator.get_elapsed_on_current_side(initial_offset)
             side_duration = self.track_estimator.current_side_duration
-            print(f"  Offset: {self.format_duration(initial_offset)} | Side {self.track_estimator.side_ind} elapsed: {self.format_duration(elapsed_on_side)} | duration: {self.format_duration(side_duration)}")
+            lines.append(f"  Offset: {self.format_duration(initial_offset)} | Side {self.track_estimator.side_ind} elapsed: {self.format_duration(elapsed_on_side)} | duration: {self.format_duration(side_duration)}")
             while elapsed_on_side >= side_duration and side_duration > 0:
                 if not self.track_estimator.next_side(auto_advance=True):
                     break
-                print(f"  >> Auto-advanced to Side {self.track_estimator.side_ind}")
+                lines.append(f"  >> Auto-advanced to Side {self.track_estimator.side_ind}")
                 elapsed_on_side = self.track_estimator.get_elapsed_on_current_side(initial_offset)
                 side_duration = self.track_estimator.current_side_duration
 
-        print(f"{'='*50}")
+        lines.append("=" * 50)
+        self._print_message("\n".join(lines))
 
     def _transition_to_stopped(self, current_time: float) -> None:
         """Transition to STOPPED state."""
@@ -233,29 +385,34 @@ class AudioDetector:
         self.state = PlaybackState.STOPPED
         self.candidate_start_time = None
         self.candidate_stop_time = None
-        print(f"\n{'='*50}")
-        print(f"⏹ MUSIC STOPPED at {time.strftime('%H:%M:%S')}")
-        print(f"  Session duration: {self.format_duration(effective_duration)}")
-        print(f"  Total playback:   {self.format_duration(self.total_playback_seconds)}")
+        # Banner is collected and written in one go to keep the analysis loop stall short
+        lines = [
+            "",
+            "=" * 50,
+            f"⏹ MUSIC STOPPED at {time.strftime('%H:%M:%S')}",
+            f"  Session duration: {self.format_duration(effective_duration)}",
+            f"  Total playback:   {self.format_duration(self.total_playback_seconds)}",
+        ]
 
         # Auto-advance to next side if elapsed time on current side exceeded side duration
         if self.track_estimator:
             elapsed_on_side = self.track_estimator.get_elapsed_on_current_side(effective_duration)
             side_duration = self.track_estimator.current_side_duration
-            print(f"  Effective: {self.format_duration(effective_duration)} | Side {self.track_estimator.side_ind} elapsed: {self.format_duration(elapsed_on_side)} | duration: {self.format_duration(side_duration)}")
+            lines.append(f"  Effective: {self.format_duration(effective_duration)} | Side {self.track_estimator.side_ind} elapsed: {self.format_duration(elapsed_on_side)} | duration: {self.format_duration(side_duration)}")
             while elapsed_on_side >= side_duration and side_duration > 0:
                 if not self.track_estimator.next_side(auto_advance=True):
                     break
-                print(f"  >> Auto-advanced to Side {self.track_estimator.side_ind}")
+                lines.append(f"  >> Auto-advanced to Side {self.track_estimator.side_ind}")
                 elapsed_on_side = self.track_estimator.get_elapsed_on_current_side(effective_duration)
                 side_duration = self.track_estimator.current_side_duration
 
-        print(f"{'='*50}")
+        lines.append("=" * 50)
+        self._print_message("\n".join(lines))
 
     def get_current_duration(self) -> float:
         """Get current session duration if playing, including offsets."""
         if self.state == PlaybackState.PLAYING and self.playback_start_time:
-            base_duration = time.time() - self.playback_start_time
+            base_duration = time.monotonic() - self.playback_start_time
             return base_duration + DETECTION_DELAY_SECONDS + get_debug_playback_offset()
         return 0.0
 
@@ -267,16 +424,18 @@ class AudioDetector:
             if album:
                 self.album = album
                 self.track_estimator = TrackEstimator(album)
-                print(f"\n{'='*50}")
-                print(f"Loaded album: {album_id}")
-                print(f"Sides: {', '.join(s.ind for s in album.sides)}")
-                print(f"{'='*50}")
+                self._print_message(
+                    f"\n{'='*50}\n"
+                    f"Loaded album: {album_id}\n"
+                    f"Sides: {', '.join(s.ind for s in album.sides)}\n"
+                    f"{'='*50}"
+                )
                 return True
             else:
-                print(f"\nAlbum {album_id} not found")
+                self._print_message(f"\nAlbum {album_id} not found")
                 return False
         except ValueError:
-            print(f"\nInvalid album ID: {album_id_str}")
+            self._print_message(f"\nInvalid album ID: {album_id_str}")
             return False
 
     def handle_keyboard(self) -> None:
@@ -293,32 +452,31 @@ class AudioDetector:
             self.input_display = ""
         elif action == "next_side" and self.track_estimator:
             if self.track_estimator.next_side():
-                print(f"\n>> Side {self.track_estimator.side_ind}")
+                self._print_message(f"\n>> Side {self.track_estimator.side_ind}")
         elif action == "prev_side" and self.track_estimator:
             if self.track_estimator.prev_side():
-                print(f"\n<< Side {self.track_estimator.side_ind}")
+                self._print_message(f"\n<< Side {self.track_estimator.side_ind}")
 
-    def display_status(self, audio_data: np.ndarray) -> None:
-        """Display current status on single line."""
-        rms = self.compute_rms(audio_data)
-        bandwidth = self.compute_spectral_bandwidth(audio_data)
+    def _print_message(self, text: str) -> None:
+        """Print a message below the status line and force the next status repaint."""
+        print(text)
+        self._last_status_line = ""
 
-        status_icon = {
-            PlaybackState.IDLE: "⏸",
-            PlaybackState.PLAYING: "▶",
-            PlaybackState.STOPPED: "⏹",
-        }[self.state]
+    def display_status(self) -> None:
+        """Display current status on single line."""
+        status_icon = STATUS_ICONS[self.state]
 
         current_duration = self.get_current_duration()
         total = self.total_playback_seconds + (current_duration if self.state == PlaybackState.PLAYING else 0)
 
         # Auto-advance side if elapsed time on current side exceeds side duration
-        if self.track_estimator and self.state == PlaybackState.PLAYING:
-            elapsed_on_side = self.track_estimator.get_elapsed_on_current_side(current_duration)
-            side_duration = self.track_estimator.current_side_duration
-            if elapsed_on_side >= side_duration and side_duration > 0:
-                if self.track_estimator.next_side(auto_advance=True):
-                    print(f"\n  >> Auto-advanced to Side {self.track_estimator.side_ind}")
+        if (
+            self.track_estimator
+            and self.state == PlaybackState.PLAYING
+            and current_duration >= self.track_estimator.current_side_end
+        ):
+            if self.track_estimator.next_side(auto_advance=True):
+                self._print_message(f"\n  >> Auto-advanced to Side {self.track_estimator.side_ind}")
 
         # Build track info
         track_info = ""
@@ -356,8 +514,16 @@ class AudioDetector:
                 f"Total: {self.format_duration(total):>8} | {hint}"
             )
 
-        # Clear line and print
-        print(f"{status:<100}", end="", flush=True)
+        # Clear line and print; the line only changes about once a second, so skip
+        # the terminal write on ticks where it would repaint identical text
+        line = f"{status:<100}"
+        if line != self._last_status_line:
+            # Write encoded bytes straight to the binary buffer, bypassing the text layer;
+            # flush any pending banner text first so output stays in order
+            sys.stdout.flush()
+            sys.stdout.buffer.write(line.encode(sys.stdout.encoding))
+            sys.stdout.buffer.flush()
+            self._last_status_line = line
 
     def start(self) -> None:
         """Start audio detection."""
@@ -368,6 +534,10 @@ class AudioDetector:
         print(f"RMS Start Threshold: {self.rms_threshold}")
         print(f"RMS Stop Threshold: {self.rms_stop_threshold}")
         print(f"Bandwidth Threshold: {self.bandwidth_threshold} Hz")
+        if self.fft_decimation > 1:
+            print(f"FFT Decimation: {self.fft_decimation}x")
+        if self._nfft != len(self._window):
+            print(f"FFT Size: {self._nfft} (chunk zero-padded from {len(self._window)})")
         print(f"Start Confirm: {self.start_confirm_seconds}s")
         print(f"Stop Confirm: {self.stop_confirm_seconds}s")
         print("=" * 50)
@@ -385,19 +555,34 @@ class AudioDetector:
                 rate=self.sample_rate,
                 input=True,
                 frames_per_buffer=self.chunk_size,
+                stream_callback=self._on_audio,
             )
 
             while True:
-                raw_data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-                audio_data = np.frombuffer(raw_data, dtype=np.float32)
+                try:
+                    first = self._ready.get(timeout=CHUNK_WAIT_SECONDS)
+                except queue.Empty:
+                    # The callback stream ends on device errors; don't wait on it forever
+                    if not self.stream.is_active():
+                        raise RuntimeError("Audio input stream stopped")
+                    continue
+                count = 1
+                # Catch up on a backlog in one batch; stop at the end of the ring so the
+                # batch stays a contiguous view of consecutive slots
+                while count < MAX_BATCH_CHUNKS and first + count < RING_CHUNKS:
+                    try:
+                        self._ready.get_nowait()
+                    except queue.Empty:
+                        break
+                    count += 1
 
                 self.handle_keyboard()
-                self.update_state(audio_data)
+                self._process_chunks(self._ring[first:first + count])
 
                 # Throttle display updates to reduce CPU usage
-                current_time = time.time()
+                current_time = time.monotonic()
                 if current_time - self.last_display_time >= self.display_interval:
-                    self.display_status(audio_data)
+                    self.display_status()
                     self.last_display_time = current_time
 
         except KeyboardInterrupt:
@@ -418,6 +603,8 @@ class AudioDetector:
         print("=" * 50)
         print(f"Total playback time: {self.format_duration(self.total_playback_seconds)}")
         print(f"Total hours: {self.total_playback_seconds / 3600:.2f}h")
+        if self.dropped_chunks:
+            print(f"Dropped audio chunks: {self.dropped_chunks}")
         print("=" * 50)
 
 
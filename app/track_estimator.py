@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from .album_loader import Album, Track
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CurrentTrack:
     artist: str
     title: str
@@ -20,6 +20,10 @@ class TrackEstimator:
         self.album = album
         self.current_side_index = 0
         self.completed_sides_duration = 0.0  # Cumulative duration of sides we've passed
+        # One CurrentTrack per (side index, track index); the album never changes under us
+        self._track_cache: dict[tuple[int, int], CurrentTrack] = {}
+        self.current_side_end = 0.0
+        self._update_side_end()
 
     @property
     def current_side(self):
@@ -40,7 +44,18 @@ class TrackEstimator:
         side = self.current_side
         if not side:
             return 0.0
-        return sum(track.duration_seconds for track in side.tracks)
+        return side.duration_seconds
+
+    def _update_side_end(self) -> None:
+        """Recompute the total elapsed time at which the current side runs out.
+
+        Sides with no known duration never run out, so they never auto-advance.
+        """
+        side_duration = self.current_side_duration
+        if side_duration > 0:
+            self.current_side_end = self.completed_sides_duration + side_duration
+        else:
+            self.current_side_end = float("inf")
 
     def get_elapsed_on_current_side(self, total_elapsed: float) -> float:
         """Get elapsed time on current side (total minus completed sides)."""
@@ -58,6 +73,7 @@ class TrackEstimator:
                 # Add current side's duration to completed total before advancing
                 self.completed_sides_duration += self.current_side_duration
             self.current_side_index += 1
+            self._update_side_end()
             return True
         return False
 
@@ -76,6 +92,7 @@ class TrackEstimator:
                 self.completed_sides_duration = max(0.0, self.completed_sides_duration)
             else:
                 self.current_side_index -= 1
+            self._update_side_end()
             return True
         return False
 
@@ -85,22 +102,15 @@ class TrackEstimator:
         if not side or not side.tracks:
             return None
 
-        cumulative = 0.0
-        for track in side.tracks:
-            cumulative += track.duration_seconds
-            if elapsed_seconds < cumulative:
-                return CurrentTrack(
-                    artist=track.artist,
-                    title=track.title,
-                    position=track.position,
-                    side_ind=side.ind,
-                )
-
-        # Elapsed time exceeds side duration - return last track
-        last_track = side.tracks[-1]
-        return CurrentTrack(
-            artist=last_track.artist,
-            title=last_track.title,
-            position=last_track.position,
-            side_ind=side.ind,
-        )
+        key = (self.current_side_index, side.track_index_at(elapsed_seconds))
+        current = self._track_cache.get(key)
+        if current is None:
+            track = side.tracks[key[1]]
+            current = CurrentTrack(
+                artist=track.artist,
+                title=track.title,
+                position=track.position,
+                side_ind=side.ind,
+            )
+            self._track_cache[key] = current
+        return current